@@ -46,6 +46,7 @@ from hummingbot.core.event.events import (
     TradeType,
     BuyOrderCompletedEvent,
     OrderFilledEvent,
+    OrderFilledEventBatch,
     SellOrderCompletedEvent,
     MarketOrderFailureEvent,
     OrderBookEvent,
@@ -470,7 +471,7 @@ cdef class PaperTradeExchange(ExchangeBase):
         # add fee
         fees = estimate_fee(self.name, False)
 
-        order_filled_events = OrderFilledEvent.order_filled_events_from_order_book_rows(
+        order_filled_events = OrderFilledEventBatch.from_order_book_rows(
             self._current_timestamp, order_id, trading_pair, TradeType.BUY, OrderType.MARKET,
             fees, buy_entries
         )
@@ -530,7 +531,7 @@ cdef class PaperTradeExchange(ExchangeBase):
         # add fee
         fees = estimate_fee(self.name, False)
 
-        order_filled_events = OrderFilledEvent.order_filled_events_from_order_book_rows(
+        order_filled_events = OrderFilledEventBatch.from_order_book_rows(
             self._current_timestamp, order_id, trading_pair_str, TradeType.SELL,
             OrderType.MARKET, fees, sell_entries
         )
@@ -1,11 +1,72 @@
 #!/usr/bin/env python
-from dataclasses import dataclass
+import sys
+from dataclasses import FrozenInstanceError, dataclass, fields
 from decimal import Decimal
 from enum import Enum
-from typing import Dict, List, NamedTuple, Optional
+from typing import Any, Dict, Final, FrozenSet, Iterator, List, NamedTuple, Optional, Tuple
+
+import numpy as np
 
 from hummingbot.core.data_type.order_book_row import OrderBookRow
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee, TokenAmount, TradeFeeBase
+from hummingbot.core.event.events_fast import OrderBookTradeEvent  # noqa: F401
+
+
+# Same as @dataclass(slots=True), which needs Python 3.10+
+def _slotted(cls):
+    inherited_slots = {name for base in cls.__mro__[1:] for name in getattr(base, "__slots__", ())}
+    field_names = tuple(f.name for f in fields(cls) if f.name not in inherited_slots)
+    cls_dict = dict(cls.__dict__)
+    cls_dict["__slots__"] = field_names
+    for field_name in field_names:
+        # Defaults are already captured by the generated __init__ and would clash with the slot descriptors
+        cls_dict.pop(field_name, None)
+    cls_dict.pop("__dict__", None)
+    cls_dict.pop("__weakref__", None)
+    if cls.__dataclass_params__.frozen:
+        # The default pickle protocol restores slots through setattr, which frozen dataclasses reject
+        cls_dict["__getstate__"] = _slotted_frozen_getstate
+        cls_dict["__setstate__"] = _slotted_frozen_setstate
+        # The generated __setattr__ and __delattr__ refer to the class before it is re-created
+        cls_dict["__setattr__"] = _slotted_frozen_setattr
+        cls_dict["__delattr__"] = _slotted_frozen_delattr
+    slotted_cls = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+    slotted_cls.__qualname__ = cls.__qualname__
+    return slotted_cls
+
+
+def _slotted_frozen_getstate(self):
+    return [getattr(self, f.name) for f in fields(self)]
+
+
+def _slotted_frozen_setstate(self, state):
+    for f, value in zip(fields(self), state):
+        object.__setattr__(self, f.name, value)
+
+
+def _slotted_frozen_setattr(self, name, value):
+    raise FrozenInstanceError(f"cannot assign to field {name!r}")
+
+
+def _slotted_frozen_delattr(self, name):
+    raise FrozenInstanceError(f"cannot delete field {name!r}")
+
+
+_DECIMAL_CACHE: Final[Dict[str, Decimal]] = {}
+_DECIMAL_CACHE_MAX_SIZE: Final = 4096
+
+
+def _cached_decimal(value, _cache=_DECIMAL_CACHE, _max_size=_DECIMAL_CACHE_MAX_SIZE, _decimal=Decimal) -> Decimal:
+    # Only strings are cached, numbers like 0 and -0.0 compare equal but are different Decimals
+    if value.__class__ is not str:
+        return _decimal(value)
+    result = _cache.get(value)
+    if result is None:
+        result = _decimal(value)
+        if len(_cache) >= _max_size:
+            _cache.clear()
+        _cache[value] = result
+    return result
 
 
 class MarketEvent(Enum):
@@ -49,7 +110,18 @@ class OrderType(Enum):
     LIMIT_MAKER = 3
 
     def is_limit_type(self):
-        return self in (OrderType.LIMIT, OrderType.LIMIT_MAKER)
+        return self in _ORDER_TYPE_LIMIT_SET
+
+
+# Lookup tables for the exchange message parsing paths
+_ORDER_TYPE_BY_NAME: Final[Dict[str, OrderType]] = {order_type.name: order_type for order_type in OrderType}
+_ORDER_TYPE_LIMIT_SET: Final[FrozenSet[OrderType]] = frozenset({OrderType.LIMIT, OrderType.LIMIT_MAKER})
+_TRADE_TYPE_BY_SIDE_INITIAL: Final[Dict[str, TradeType]] = {"B": TradeType.BUY, "S": TradeType.SELL}
+_BINANCE_TRADE_EXECUTION_TYPES: Final[FrozenSet[str]] = frozenset({"TRADE"})
+# Shared by all the fills reported without commission
+_BINANCE_NO_TRADE_FEE: Final[AddedToCostTradeFee] = AddedToCostTradeFee()
+_BINANCE_TRADE_FEE_CACHE: Final[Dict[Tuple[str, str], AddedToCostTradeFee]] = {}
+_BINANCE_TRADE_FEE_CACHE_MAX_SIZE: Final = 1024
 
 
 class PositionAction(Enum):
@@ -100,7 +172,8 @@ class MarketOrderFailureEvent(NamedTuple):
     order_type: OrderType
 
 
-@dataclass
+@_slotted
+@dataclass(eq=False)
 class BuyOrderCompletedEvent:
     timestamp: float
     order_id: str
@@ -114,7 +187,8 @@ class BuyOrderCompletedEvent:
     exchange_order_id: Optional[str] = None
 
 
-@dataclass
+@_slotted
+@dataclass(eq=False)
 class SellOrderCompletedEvent:
     timestamp: float
     order_id: str
@@ -128,7 +202,8 @@ class SellOrderCompletedEvent:
     exchange_order_id: Optional[str] = None
 
 
-@dataclass
+@_slotted
+@dataclass(eq=False)
 class OrderCancelledEvent:
     timestamp: float
     order_id: str
@@ -140,7 +215,8 @@ class OrderExpiredEvent(NamedTuple):
     order_id: str
 
 
-@dataclass
+@_slotted
+@dataclass(eq=False)
 class FundingPaymentCompletedEvent:
     timestamp: float
     market: str
@@ -149,12 +225,15 @@ class FundingPaymentCompletedEvent:
     funding_rate: Decimal
 
 
-class OrderBookTradeEvent(NamedTuple):
-    trading_pair: str
-    timestamp: float
-    type: TradeType
-    price: Decimal
-    amount: Decimal
+# Record layout written by OrderFilledEvent.to_record
+ORDER_FILLED_DTYPE: Final[np.dtype] = np.dtype([
+    ("timestamp", "f8"),
+    ("price", "f8"),
+    ("amount", "f8"),
+    ("trade_type", "i1"),
+    ("order_type", "i1"),
+    ("leverage", "i2"),
+])
 
 
 class OrderFilledEvent(NamedTuple):
@@ -182,40 +261,170 @@ class OrderFilledEvent(NamedTuple):
         order_book_rows: List[OrderBookRow],
         exchange_trade_id: str = "",
     ) -> List["OrderFilledEvent"]:
-        return [
-            OrderFilledEvent(
+        return list(OrderFilledEventBatch.from_order_book_rows(
+            timestamp, order_id, trading_pair, trade_type, order_type, trade_fee, order_book_rows, exchange_trade_id
+        ))
+
+    @classmethod
+    def from_ticks(
+        cls,
+        timestamp: float,
+        order_id: str,
+        trading_pair: str,
+        trade_type: TradeType,
+        order_type: OrderType,
+        price_ticks: int,
+        amount_ticks: int,
+        price_tick_size: Decimal,
+        amount_tick_size: Decimal,
+        trade_fee: TradeFeeBase,
+        exchange_trade_id: str = "",
+        leverage: Optional[int] = 1,
+        position: Optional[str] = "NIL",
+    ) -> "OrderFilledEvent":
+        return cls(
+            timestamp,
+            order_id,
+            trading_pair,
+            trade_type,
+            order_type,
+            int(price_ticks) * price_tick_size,
+            int(amount_ticks) * amount_tick_size,
+            trade_fee,
+            exchange_trade_id,
+            leverage,
+            position,
+        )
+
+    @classmethod
+    def order_filled_event_from_binance_execution_report(cls, execution_report: Dict[str, any]) -> "OrderFilledEvent":
+        return _order_filled_event_from_binance_execution_report(execution_report)
+
+    def to_record(self, out: np.ndarray, i: int):
+        out[i] = (
+            self.timestamp,
+            float(self.price),
+            float(self.amount),
+            self.trade_type.value,
+            self.order_type.value,
+            1 if self.leverage is None else self.leverage,
+        )
+
+
+def _binance_trade_fee(
+    fee_asset: str,
+    fee_amount: str,
+    _cache=_BINANCE_TRADE_FEE_CACHE,
+    _max_size=_BINANCE_TRADE_FEE_CACHE_MAX_SIZE,
+    _decimal=_cached_decimal,
+    _added_to_cost_trade_fee=AddedToCostTradeFee,
+    _token_amount=TokenAmount,
+    _no_fee=_BINANCE_NO_TRADE_FEE,
+) -> AddedToCostTradeFee:
+    key = (fee_asset, fee_amount)
+    trade_fee = _cache.get(key)
+    if trade_fee is None:
+        amount = _decimal(fee_amount)
+        trade_fee = _added_to_cost_trade_fee(flat_fees=[_token_amount(fee_asset, amount)]) if amount else _no_fee
+        if len(_cache) >= _max_size:
+            _cache.clear()
+        _cache[key] = trade_fee
+    return trade_fee
+
+
+def _order_filled_event_from_binance_execution_report(
+    execution_report: Dict[str, any],
+    # Globals pinned as default arguments so that the per message lookups are local variable loads
+    _decimal=_cached_decimal,
+    _binance_trade_fee=_binance_trade_fee,
+    _order_filled_event=OrderFilledEvent,
+    _trade_type_by_side_initial=_TRADE_TYPE_BY_SIDE_INITIAL,
+    _order_type_by_name=_ORDER_TYPE_BY_NAME,
+    _trade_execution_types=_BINANCE_TRADE_EXECUTION_TYPES,
+    _intern=sys.intern,
+) -> OrderFilledEvent:
+    execution_type: str = execution_report.get("x")
+    if execution_type not in _trade_execution_types:
+        raise ValueError(f"Invalid execution type '{execution_type}'.")
+    return _order_filled_event(
+        execution_report["E"] * 1e-3,
+        # Interned so that dict lookups keyed by order id or trading pair downstream can match on identity
+        _intern(execution_report["c"]),
+        _intern(execution_report["s"]),
+        _trade_type_by_side_initial[execution_report["S"][0]],
+        _order_type_by_name[execution_report["o"]],
+        _decimal(execution_report["L"]),
+        _decimal(execution_report["l"]),
+        _binance_trade_fee(execution_report["N"], execution_report["n"]),
+        execution_report["t"],
+    )
+
+
+@_slotted
+@dataclass(frozen=True, eq=False)
+class OrderFilledEventBatch:
+    timestamp: float
+    order_id: str
+    trading_pair: str
+    trade_type: TradeType
+    order_type: OrderType
+    trade_fee: TradeFeeBase
+    prices: Tuple[Any, ...]
+    amounts: Tuple[Any, ...]
+    exchange_trade_id: str = ""
+
+    @classmethod
+    def from_order_book_rows(
+        cls,
+        timestamp: float,
+        order_id: str,
+        trading_pair: str,
+        trade_type: TradeType,
+        order_type: OrderType,
+        trade_fee: TradeFeeBase,
+        order_book_rows: List[OrderBookRow],
+        exchange_trade_id: str = "",
+    ) -> "OrderFilledEventBatch":
+        return cls(
+            timestamp,
+            order_id,
+            sys.intern(trading_pair),
+            trade_type,
+            order_type,
+            trade_fee,
+            tuple(r.price for r in order_book_rows),
+            tuple(r.amount for r in order_book_rows),
+            exchange_trade_id,
+        )
+
+    def __len__(self) -> int:
+        return len(self.prices)
+
+    def __iter__(self) -> Iterator[OrderFilledEvent]:
+        timestamp = self.timestamp
+        order_id = self.order_id
+        trading_pair = self.trading_pair
+        trade_type = self.trade_type
+        order_type = self.order_type
+        trade_fee = self.trade_fee
+        exchange_trade_id = self.exchange_trade_id
+        for price, amount in zip(self.prices, self.amounts):
+            # Through str() so that e.g. 0.1 is not read as its exact binary expansion
+            yield OrderFilledEvent(
                 timestamp,
                 order_id,
                 trading_pair,
                 trade_type,
                 order_type,
-                Decimal(r.price),
-                Decimal(r.amount),
+                Decimal(str(price)),
+                Decimal(str(amount)),
                 trade_fee,
-                exchange_trade_id=exchange_trade_id,
+                exchange_trade_id,
             )
-            for r in order_book_rows
-        ]
-
-    @classmethod
-    def order_filled_event_from_binance_execution_report(cls, execution_report: Dict[str, any]) -> "OrderFilledEvent":
-        execution_type: str = execution_report.get("x")
-        if execution_type != "TRADE":
-            raise ValueError(f"Invalid execution type '{execution_type}'.")
-        return OrderFilledEvent(
-            execution_report["E"] * 1e-3,
-            execution_report["c"],
-            execution_report["s"],
-            TradeType.BUY if execution_report["S"] == "BUY" else TradeType.SELL,
-            OrderType[execution_report["o"]],
-            Decimal(execution_report["L"]),
-            Decimal(execution_report["l"]),
-            AddedToCostTradeFee(flat_fees=[TokenAmount(execution_report["N"], Decimal(execution_report["n"]))]),
-            exchange_trade_id=execution_report["t"],
-        )
 
 
-@dataclass
+@_slotted
+@dataclass(eq=False)
 class BuyOrderCreatedEvent:
     timestamp: float
     type: OrderType
@@ -228,7 +437,8 @@ class BuyOrderCreatedEvent:
     position: Optional[str] = "NILL"
 
 
-@dataclass
+@_slotted
+@dataclass(eq=False)
 class SellOrderCreatedEvent:
     timestamp: float
     type: OrderType
@@ -241,11 +451,17 @@ class SellOrderCreatedEvent:
     position: Optional[str] = "NILL"
 
 
-@dataclass
-class RangePositionInitiatedEvent:
+@_slotted
+@dataclass(eq=False)
+class _RangePositionEventBase:
     timestamp: float
     hb_id: str
     tx_hash: str
+
+
+@_slotted
+@dataclass(eq=False)
+class RangePositionInitiatedEvent(_RangePositionEventBase):
     trading_pair: str
     fee_tier: str
     lower_price: Decimal
@@ -256,11 +472,9 @@ class RangePositionInitiatedEvent:
     gas_price: Decimal
 
 
-@dataclass
-class RangePositionCreatedEvent:
-    timestamp: float
-    hb_id: str
-    tx_hash: str
+@_slotted
+@dataclass(eq=False)
+class RangePositionCreatedEvent(_RangePositionEventBase):
     token_id: str
     trading_pair: str
     fee_tier: str
@@ -272,25 +486,25 @@ class RangePositionCreatedEvent:
     gas_price: Decimal
 
 
-@dataclass
-class RangePositionUpdatedEvent:
-    timestamp: float
-    hb_id: str
-    tx_hash: str
+@_slotted
+@dataclass(eq=False)
+class RangePositionUpdatedEvent(_RangePositionEventBase):
     token_id: str
     base_amount: Decimal
     quote_amount: Decimal
     status: str
 
 
-@dataclass
+@_slotted
+@dataclass(eq=False)
 class RangePositionRemovedEvent:
     timestamp: float
     hb_id: str
     token_id: Optional[str] = None
 
 
-@dataclass
+@_slotted
+@dataclass(eq=False)
 class RangePositionFailureEvent:
     timestamp: float
     hb_id: str
@@ -306,7 +520,22 @@ class LimitOrderStatus(Enum):
     FAILED = 6
 
 
-@dataclass
+# RemoteCmdEvent fields grouped by the type they are parsed to in from_json_data
+_RCMD_STR_FIELDS: Final = ("event_descriptor", "command", "exchange", "symbol")
+_RCMD_INT_FIELDS: Final = ("timestamp_received", "timestamp_event", "interval")
+_RCMD_DEC_FIELDS: Final = (
+    "price",
+    "volume",
+    "inventory",
+    "order_bid_spread",
+    "order_ask_spread",
+    "order_amount",
+    "order_levels",
+    "order_level_spread",
+)
+
+
+@dataclass(eq=False)
 class RemoteCmdEvent:
     event_descriptor: str
     command: str = None
@@ -326,38 +555,34 @@ class RemoteCmdEvent:
 
     @classmethod
     def from_json_data(cls, data):
-        timestamp_received = data.get("timestamp_received")
-        timestamp_event = data.get("timestamp_event")
-        interval = data.get("interval")
-        price = data.get("price")
-        volume = data.get("volume")
-        inventory = data.get("inventory")
-        order_bid_spread = data.get("order_bid_spread")
-        order_ask_spread = data.get("order_ask_spread")
-        order_amount = data.get("order_amount")
-        order_levels = data.get("order_levels")
-        order_level_spread = data.get("order_level_spread")
-        return cls(
-            event_descriptor=data.get("event_descriptor"),
-            command=data.get("command"),
-            timestamp_received=int(timestamp_received) if timestamp_received else None,
-            timestamp_event=int(timestamp_event) if timestamp_event else None,
-            exchange=data.get("exchange"),
-            symbol=data.get("symbol"),
-            interval=int(interval) if interval else None,
-            price=Decimal(price) if price else None,
-            volume=Decimal(volume) if volume else None,
-            inventory=Decimal(inventory) if inventory else None,
-            order_bid_spread=Decimal(order_bid_spread) if order_bid_spread else None,
-            order_ask_spread=Decimal(order_ask_spread) if order_ask_spread else None,
-            order_amount=Decimal(order_amount) if order_amount else None,
-            order_levels=Decimal(order_levels) if order_levels else None,
-            order_level_spread=Decimal(order_level_spread) if order_level_spread else None,
-        )
+        get = data.get
+        cached_decimal = _cached_decimal
+        kwargs = {}
+        for key in _RCMD_STR_FIELDS:
+            kwargs[key] = get(key)
+        for key in _RCMD_INT_FIELDS:
+            value = get(key)
+            kwargs[key] = int(value) if value is not None and value != "" else None
+        for key in _RCMD_DEC_FIELDS:
+            value = get(key)
+            if value is None or value == "":
+                kwargs[key] = None
+            else:
+                # Through str(), as in OrderFilledEventBatch
+                kwargs[key] = cached_decimal(str(value) if value.__class__ is float else value)
+        return cls(**kwargs)
+
+    def to_json_data(self) -> Dict[str, Any]:
+        data = {key: getattr(self, key) for key in _RCMD_STR_FIELDS}
+        for key in _RCMD_INT_FIELDS:
+            data[key] = getattr(self, key)
+        for key in _RCMD_DEC_FIELDS:
+            value = getattr(self, key)
+            data[key] = float(value) if value is not None else None
+        return data
 
     def translate_commands(self, trans_dict):
-        if self.command and trans_dict:
-            for to_be_translated in trans_dict.keys():
-                if self.command == to_be_translated:
-                    self.command = trans_dict[to_be_translated]
-                    break
+        if self.command is not None and trans_dict:
+            translated_command = trans_dict.get(self.command)
+            if translated_command is not None:
+                self.command = translated_command
@@ -0,0 +1,11 @@
+# distutils: language=c++
+
+cdef class OrderBookTradeEvent:
+    cdef:
+        readonly str trading_pair
+        readonly double timestamp
+        readonly object type
+        readonly object price
+        readonly object amount
+
+    cdef tuple _as_tuple(self)
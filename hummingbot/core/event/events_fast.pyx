@@ -0,0 +1,40 @@
+# distutils: language=c++
+
+cdef class OrderBookTradeEvent:
+    """
+    Trade reported by an order book. It replaces the former NamedTuple, keeping its field order, its read only fields
+    and its `_asdict` method, while letting other Cython modules read the fields directly from the C struct.
+    """
+    def __cinit__(self, str trading_pair, double timestamp, object type, object price, object amount):
+        self.trading_pair = trading_pair
+        self.timestamp = timestamp
+        self.type = type
+        self.price = price
+        self.amount = amount
+
+    def _asdict(self):
+        return {
+            "trading_pair": self.trading_pair,
+            "timestamp": self.timestamp,
+            "type": self.type,
+            "price": self.price,
+            "amount": self.amount,
+        }
+
+    def __eq__(self, other):
+        if not isinstance(other, OrderBookTradeEvent):
+            return NotImplemented
+        return self._as_tuple() == (<OrderBookTradeEvent>other)._as_tuple()
+
+    def __hash__(self):
+        return hash(self._as_tuple())
+
+    def __reduce__(self):
+        return OrderBookTradeEvent, self._as_tuple()
+
+    def __repr__(self):
+        return (f"OrderBookTradeEvent(trading_pair={self.trading_pair!r}, timestamp={self.timestamp!r}, "
+                f"type={self.type!r}, price={self.price!r}, amount={self.amount!r})")
+
+    cdef tuple _as_tuple(self):
+        return self.trading_pair, self.timestamp, self.type, self.price, self.amount
@@ -196,7 +196,7 @@ class RemoteCommandExecutor(PubSub):
             return
 
         payload = {
-            **remote_event.__dict__,
+            **remote_event.to_json_data(),
             # Use `timestamp_event` here, not `timestamp_received`
             "timestamp_event": int(time.time() * 1e3),
         }
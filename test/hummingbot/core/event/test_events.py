@@ -0,0 +1,471 @@
+import dataclasses
+import json
+import pickle
+import sys
+import unittest
+from decimal import Decimal
+
+import numpy as np
+
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee, TokenAmount
+from hummingbot.core.event.events import (
+    ORDER_FILLED_DTYPE,
+    BuyOrderCreatedEvent,
+    OrderBookTradeEvent,
+    OrderCancelledEvent,
+    OrderFilledEvent,
+    OrderFilledEventBatch,
+    OrderType,
+    RangePositionUpdatedEvent,
+    RemoteCmdEvent,
+    TradeType,
+    _RangePositionEventBase,
+    _binance_trade_fee,
+    _cached_decimal,
+)
+
+
+class OrderFilledEventTests(unittest.TestCase):
+    def test_order_filled_events_from_order_book_rows(self):
+        fee = AddedToCostTradeFee(percent=Decimal("0.001"))
+        rows = [OrderBookRow(0.1, 1.5, 1), OrderBookRow(10.2, 0.3, 2)]
+
+        events = OrderFilledEvent.order_filled_events_from_order_book_rows(
+            timestamp=1640001112.223,
+            order_id="OID1",
+            trading_pair="COINALPHA-HBOT",
+            trade_type=TradeType.BUY,
+            order_type=OrderType.MARKET,
+            trade_fee=fee,
+            order_book_rows=rows,
+            exchange_trade_id="TID1",
+        )
+
+        self.assertEqual(2, len(events))
+        self.assertEqual(Decimal("0.1"), events[0].price)
+        self.assertEqual(Decimal("1.5"), events[0].amount)
+        self.assertEqual(Decimal("10.2"), events[1].price)
+        self.assertEqual(Decimal("0.3"), events[1].amount)
+        for event in events:
+            self.assertEqual(1640001112.223, event.timestamp)
+            self.assertEqual("OID1", event.order_id)
+            self.assertEqual("COINALPHA-HBOT", event.trading_pair)
+            self.assertEqual(TradeType.BUY, event.trade_type)
+            self.assertEqual(OrderType.MARKET, event.order_type)
+            self.assertEqual(fee, event.trade_fee)
+            self.assertEqual("TID1", event.exchange_trade_id)
+
+    def test_order_filled_event_batch_from_order_book_rows(self):
+        fee = AddedToCostTradeFee(percent=Decimal("0.001"))
+        rows = [OrderBookRow(0.1, 1.5, 1), OrderBookRow(10.2, 0.3, 2)]
+
+        batch = OrderFilledEventBatch.from_order_book_rows(
+            1640001112.223, "OID1", "COINALPHA-HBOT", TradeType.SELL, OrderType.MARKET, fee, rows
+        )
+
+        self.assertEqual(2, len(batch))
+        self.assertEqual((0.1, 10.2), batch.prices)
+        self.assertEqual((1.5, 0.3), batch.amounts)
+        self.assertEqual(
+            [
+                OrderFilledEvent(
+                    1640001112.223, "OID1", "COINALPHA-HBOT", TradeType.SELL, OrderType.MARKET,
+                    Decimal("0.1"), Decimal("1.5"), fee
+                ),
+                OrderFilledEvent(
+                    1640001112.223, "OID1", "COINALPHA-HBOT", TradeType.SELL, OrderType.MARKET,
+                    Decimal("10.2"), Decimal("0.3"), fee
+                ),
+            ],
+            list(batch),
+        )
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            batch.order_id = "OID2"
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            batch.unknown_attribute = 1
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            del batch.order_id
+        self.assertEqual(list(batch), list(pickle.loads(pickle.dumps(batch))))
+
+    def test_from_ticks(self):
+        fee = AddedToCostTradeFee(percent=Decimal("0.001"))
+
+        event = OrderFilledEvent.from_ticks(
+            timestamp=1640001112.223,
+            order_id="OID1",
+            trading_pair="COINALPHA-HBOT",
+            trade_type=TradeType.BUY,
+            order_type=OrderType.LIMIT,
+            price_ticks=1012345,
+            amount_ticks=25,
+            price_tick_size=Decimal("0.0001"),
+            amount_tick_size=Decimal("0.1"),
+            trade_fee=fee,
+            exchange_trade_id="TID1",
+        )
+
+        self.assertEqual(Decimal("101.2345"), event.price)
+        self.assertEqual(Decimal("2.5"), event.amount)
+        self.assertEqual("TID1", event.exchange_trade_id)
+        self.assertEqual(1, event.leverage)
+        self.assertEqual("NIL", event.position)
+
+    def test_to_record(self):
+        records = np.empty(2, dtype=ORDER_FILLED_DTYPE)
+        event = OrderFilledEvent(
+            1640001112.223, "OID1", "COINALPHA-HBOT", TradeType.SELL, OrderType.LIMIT_MAKER,
+            Decimal("101.25"), Decimal("2.5"), AddedToCostTradeFee(), leverage=None
+        )
+
+        event.to_record(records, 1)
+
+        self.assertEqual(1640001112.223, records[1]["timestamp"])
+        self.assertEqual(101.25, records[1]["price"])
+        self.assertEqual(2.5, records[1]["amount"])
+        self.assertEqual(TradeType.SELL.value, records[1]["trade_type"])
+        self.assertEqual(OrderType.LIMIT_MAKER.value, records[1]["order_type"])
+        self.assertEqual(1, records[1]["leverage"])
+
+        event._replace(leverage=0).to_record(records, 0)
+
+        self.assertEqual(0, records[0]["leverage"])
+
+    def test_order_filled_event_from_binance_execution_report(self):
+        execution_report = {
+            "e": "executionReport",
+            "E": 1499405658658,
+            "s": "ETHBTC",
+            "c": "mUvoqJxFIILMdfAW5iGSOW",
+            "S": "SELL",
+            "o": "LIMIT",
+            "x": "TRADE",
+            "l": "1.00000000",
+            "L": "0.00100000",
+            "n": "0.00000010",
+            "N": "BTC",
+            "t": 1234,
+        }
+
+        event = OrderFilledEvent.order_filled_event_from_binance_execution_report(execution_report)
+
+        self.assertEqual(1499405658.658, event.timestamp)
+        self.assertEqual("mUvoqJxFIILMdfAW5iGSOW", event.order_id)
+        self.assertEqual("ETHBTC", event.trading_pair)
+        self.assertEqual(TradeType.SELL, event.trade_type)
+        self.assertEqual(OrderType.LIMIT, event.order_type)
+        self.assertEqual(Decimal("0.001"), event.price)
+        self.assertEqual(Decimal("1"), event.amount)
+        self.assertEqual([TokenAmount("BTC", Decimal("0.0000001"))], event.trade_fee.flat_fees)
+        self.assertEqual(1234, event.exchange_trade_id)
+
+    def test_order_filled_event_from_binance_execution_report_interns_order_id_and_trading_pair(self):
+        execution_report = {
+            "E": 1499405658658,
+            "s": "".join(["ETH", "BTC"]),
+            "c": "".join(["mUvoqJxF", "IILMdfAW5iGSOW"]),
+            "S": "BUY",
+            "o": "MARKET",
+            "x": "TRADE",
+            "l": "1.00000000",
+            "L": "0.00100000",
+            "n": "0.00000010",
+            "N": "BTC",
+            "t": 1234,
+        }
+
+        event = OrderFilledEvent.order_filled_event_from_binance_execution_report(execution_report)
+
+        self.assertIs(sys.intern("ETHBTC"), event.trading_pair)
+        self.assertIs(sys.intern("mUvoqJxFIILMdfAW5iGSOW"), event.order_id)
+
+    def test_order_filled_event_from_binance_execution_report_without_commission(self):
+        execution_report = {
+            "E": 1499405658658,
+            "s": "ETHBTC",
+            "c": "mUvoqJxFIILMdfAW5iGSOW",
+            "S": "BUY",
+            "o": "LIMIT_MAKER",
+            "x": "TRADE",
+            "l": "1.00000000",
+            "L": "0.00100000",
+            "n": "0.00000000",
+            "N": None,
+            "t": 1234,
+        }
+
+        event = OrderFilledEvent.order_filled_event_from_binance_execution_report(execution_report)
+
+        self.assertEqual(TradeType.BUY, event.trade_type)
+        self.assertEqual(OrderType.LIMIT_MAKER, event.order_type)
+        self.assertEqual(Decimal("0"), event.trade_fee.percent)
+        self.assertEqual([], event.trade_fee.flat_fees)
+
+    def test_order_filled_event_from_binance_execution_report_reuses_fee_for_same_commission(self):
+        execution_report = {
+            "E": 1499405658658, "s": "ETHBTC", "c": "OID1", "S": "BUY", "o": "LIMIT", "x": "TRADE",
+            "l": "1.00000000", "L": "0.00100000", "n": "0.00075000", "N": "BNB", "t": 1234,
+        }
+        other_execution_report = dict(execution_report, c="OID2", t=1235)
+
+        event = OrderFilledEvent.order_filled_event_from_binance_execution_report(execution_report)
+        other_event = OrderFilledEvent.order_filled_event_from_binance_execution_report(other_execution_report)
+
+        self.assertEqual([TokenAmount("BNB", Decimal("0.00075"))], other_event.trade_fee.flat_fees)
+        self.assertIs(event.trade_fee, other_event.trade_fee)
+
+    def test_binance_trade_fee_clears_the_cache_when_full(self):
+        cache = {}
+
+        first_fee = _binance_trade_fee("BNB", "0.00075000", _cache=cache, _max_size=2)
+        _binance_trade_fee("BNB", "0.00076000", _cache=cache, _max_size=2)
+        third_fee = _binance_trade_fee("BNB", "0.00077000", _cache=cache, _max_size=2)
+
+        self.assertEqual({("BNB", "0.00077000"): third_fee}, cache)
+        self.assertIsNot(first_fee, _binance_trade_fee("BNB", "0.00075000", _cache=cache, _max_size=2))
+        self.assertIs(third_fee, _binance_trade_fee("BNB", "0.00077000", _cache=cache, _max_size=2))
+
+    def test_order_filled_event_from_binance_execution_report_fails_for_non_trade_report(self):
+        execution_report = {"x": "NEW", "S": "BUY", "o": "LIMIT"}
+
+        with self.assertRaises(ValueError):
+            OrderFilledEvent.order_filled_event_from_binance_execution_report(execution_report)
+
+
+class OrderBookTradeEventTests(unittest.TestCase):
+    def test_positional_and_keyword_construction_share_field_order(self):
+        event = OrderBookTradeEvent("COINALPHA-HBOT", 1640001112.223, TradeType.BUY, Decimal("10"), Decimal("2"))
+        keyword_event = OrderBookTradeEvent(
+            trading_pair="COINALPHA-HBOT",
+            timestamp=1640001112.223,
+            type=TradeType.BUY,
+            price=Decimal("10"),
+            amount=Decimal("2"),
+        )
+
+        self.assertEqual("COINALPHA-HBOT", event.trading_pair)
+        self.assertEqual(1640001112.223, event.timestamp)
+        self.assertEqual(TradeType.BUY, event.type)
+        self.assertEqual(Decimal("10"), event.price)
+        self.assertEqual(Decimal("2"), event.amount)
+        self.assertEqual(event, keyword_event)
+
+    def test_timestamp_is_stored_as_float(self):
+        event = OrderBookTradeEvent("COINALPHA-HBOT", 5, TradeType.BUY, 10.0, 2.0)
+
+        self.assertIsInstance(event.timestamp, float)
+        self.assertEqual(5.0, event.timestamp)
+
+    def test_is_not_a_tuple(self):
+        event = OrderBookTradeEvent("COINALPHA-HBOT", 1640001112.223, TradeType.BUY, 10.0, 2.0)
+
+        self.assertNotIsInstance(event, tuple)
+        with self.assertRaises(TypeError):
+            event[0]
+
+    def test_fields_are_read_only(self):
+        event = OrderBookTradeEvent("COINALPHA-HBOT", 1640001112.223, TradeType.BUY, 10.0, 2.0)
+
+        with self.assertRaises(AttributeError):
+            event.price = 11.0
+
+    def test_asdict(self):
+        event = OrderBookTradeEvent("COINALPHA-HBOT", 1640001112.223, TradeType.SELL, 10.0, 2.0)
+
+        self.assertEqual(
+            {
+                "trading_pair": "COINALPHA-HBOT",
+                "timestamp": 1640001112.223,
+                "type": TradeType.SELL,
+                "price": 10.0,
+                "amount": 2.0,
+            },
+            event._asdict(),
+        )
+
+    def test_equality_and_hash_are_value_based(self):
+        event = OrderBookTradeEvent("COINALPHA-HBOT", 1640001112.223, TradeType.BUY, 10.0, 2.0)
+        same_event = OrderBookTradeEvent("COINALPHA-HBOT", 1640001112.223, TradeType.BUY, 10.0, 2.0)
+        other_event = OrderBookTradeEvent("COINALPHA-HBOT", 1640001112.223, TradeType.SELL, 10.0, 2.0)
+
+        self.assertEqual(event, same_event)
+        self.assertEqual(hash(event), hash(same_event))
+        self.assertNotEqual(event, other_event)
+        self.assertEqual(2, len({event, same_event, other_event}))
+
+    def test_pickle(self):
+        event = OrderBookTradeEvent("COINALPHA-HBOT", 1640001112.223, TradeType.BUY, Decimal("10"), Decimal("2"))
+
+        self.assertEqual(event, pickle.loads(pickle.dumps(event)))
+
+    def test_repr(self):
+        event = OrderBookTradeEvent("COINALPHA-HBOT", 1640001112.223, TradeType.BUY, 10.0, 2.0)
+
+        self.assertEqual(
+            "OrderBookTradeEvent(trading_pair='COINALPHA-HBOT', timestamp=1640001112.223, "
+            "type=<TradeType.BUY: 1>, price=10.0, amount=2.0)",
+            repr(event),
+        )
+
+
+class OrderTypeTests(unittest.TestCase):
+    def test_is_limit_type(self):
+        self.assertTrue(OrderType.LIMIT.is_limit_type())
+        self.assertTrue(OrderType.LIMIT_MAKER.is_limit_type())
+        self.assertFalse(OrderType.MARKET.is_limit_type())
+
+
+class RemoteCmdEventTests(unittest.TestCase):
+    def test_from_json_data(self):
+        data = {
+            "event_descriptor": "SYMBOL_EVENT",
+            "command": "balance",
+            "timestamp_received": "1640001112223",
+            "timestamp_event": 1640001112000,
+            "exchange": "binance",
+            "symbol": "ETHBTC",
+            "interval": "60",
+            "price": "0.001",
+            "volume": 0,
+            "order_amount": "0",
+        }
+
+        event = RemoteCmdEvent.from_json_data(data)
+
+        self.assertEqual("SYMBOL_EVENT", event.event_descriptor)
+        self.assertEqual("balance", event.command)
+        self.assertEqual(1640001112223, event.timestamp_received)
+        self.assertEqual(1640001112000, event.timestamp_event)
+        self.assertEqual("binance", event.exchange)
+        self.assertEqual("ETHBTC", event.symbol)
+        self.assertEqual(60, event.interval)
+        self.assertEqual(Decimal("0.001"), event.price)
+        self.assertEqual(Decimal("0"), event.volume)
+        self.assertEqual(Decimal("0"), event.order_amount)
+        self.assertIsNone(event.inventory)
+        self.assertIsNone(event.order_bid_spread)
+        self.assertIsNone(event.order_ask_spread)
+        self.assertIsNone(event.order_levels)
+        self.assertIsNone(event.order_level_spread)
+
+    def test_from_json_data_maps_empty_strings_to_none(self):
+        event = RemoteCmdEvent.from_json_data(
+            {"event_descriptor": "SYMBOL_EVENT", "interval": "", "price": "", "order_amount": ""}
+        )
+
+        self.assertIsNone(event.interval)
+        self.assertIsNone(event.price)
+        self.assertIsNone(event.order_amount)
+
+    def test_from_json_data_reuses_decimals_for_repeated_values(self):
+        first_event = RemoteCmdEvent.from_json_data({"event_descriptor": "SYMBOL_EVENT", "price": "101.25"})
+        second_event = RemoteCmdEvent.from_json_data({"event_descriptor": "SYMBOL_EVENT", "price": "101.25"})
+
+        self.assertEqual(Decimal("101.25"), second_event.price)
+        self.assertIs(first_event.price, second_event.price)
+
+    def test_from_json_data_keeps_the_sign_of_negative_zero(self):
+        RemoteCmdEvent.from_json_data({"event_descriptor": "SYMBOL_EVENT", "price": 0})
+        event = RemoteCmdEvent.from_json_data({"event_descriptor": "SYMBOL_EVENT", "price": -0.0})
+
+        self.assertTrue(event.price.is_signed())
+        self.assertEqual("-0.0", str(event.price))
+
+    def test_cached_decimal_clears_the_cache_when_full(self):
+        cache = {}
+
+        first = _cached_decimal("1", _cache=cache, _max_size=2)
+        _cached_decimal("2", _cache=cache, _max_size=2)
+        third = _cached_decimal("3", _cache=cache, _max_size=2)
+
+        self.assertEqual({"3": third}, cache)
+        self.assertIsNot(first, _cached_decimal("1", _cache=cache, _max_size=2))
+        self.assertIs(third, _cached_decimal("3", _cache=cache, _max_size=2))
+
+    def test_to_json_data(self):
+        event = RemoteCmdEvent(
+            event_descriptor="SYMBOL_EVENT",
+            command="balance",
+            timestamp_received=1640001112223,
+            interval=60,
+            price=Decimal("0.5"),
+            inventory=Decimal("0.1"),
+            order_amount=Decimal("10"),
+        )
+
+        data = event.to_json_data()
+
+        self.assertEqual("SYMBOL_EVENT", data["event_descriptor"])
+        self.assertEqual("balance", data["command"])
+        self.assertEqual(1640001112223, data["timestamp_received"])
+        self.assertIsNone(data["timestamp_event"])
+        self.assertEqual(60, data["interval"])
+        self.assertIsInstance(data["price"], float)
+        self.assertEqual(0.5, data["price"])
+        self.assertEqual(0.0, data["volume"])
+        self.assertEqual(0.1, data["inventory"])
+        self.assertEqual(10.0, data["order_amount"])
+        self.assertIsNone(data["order_levels"])
+        self.assertEqual(set(dataclasses.asdict(event)), set(data))
+
+        decoded_event = RemoteCmdEvent.from_json_data(json.loads(json.dumps(data)))
+
+        self.assertEqual(dataclasses.asdict(event), dataclasses.asdict(decoded_event))
+        self.assertEqual("0.1", str(decoded_event.inventory))
+
+    def test_translate_commands(self):
+        event = RemoteCmdEvent(event_descriptor="SYMBOL_EVENT", command="start_bot")
+
+        event.translate_commands({"stop_bot": "stop", "start_bot": "start"})
+
+        self.assertEqual("start", event.command)
+
+        event.translate_commands({"stop_bot": "stop"})
+
+        self.assertEqual("start", event.command)
+
+
+class DataclassEventTests(unittest.TestCase):
+    def test_dataclass_events_have_no_instance_dict(self):
+        event = BuyOrderCreatedEvent(
+            timestamp=1640001112.223,
+            type=OrderType.LIMIT,
+            trading_pair="COINALPHA-HBOT",
+            amount=Decimal("1"),
+            price=Decimal("10"),
+            order_id="OID1",
+        )
+
+        self.assertFalse(hasattr(event, "__dict__"))
+        self.assertIsNone(event.exchange_order_id)
+        self.assertEqual(1, event.leverage)
+        self.assertEqual("NILL", event.position)
+        self.assertEqual("OID1", dataclasses.asdict(event)["order_id"])
+        with self.assertRaises(AttributeError):
+            event.unknown_attribute = 1
+
+    def test_dataclass_events_compare_by_identity(self):
+        first_event = OrderCancelledEvent(timestamp=1640001112.223, order_id="OID1")
+        second_event = OrderCancelledEvent(timestamp=1640001112.223, order_id="OID1")
+
+        self.assertEqual(first_event, first_event)
+        self.assertNotEqual(first_event, second_event)
+        self.assertEqual(2, len({first_event, second_event}))
+
+    def test_range_position_events_keep_positional_field_order(self):
+        event = RangePositionUpdatedEvent(1640001112.223, "HBID1", "0xTX", "42", Decimal("1"), Decimal("2"), "OPEN")
+
+        self.assertIsInstance(event, _RangePositionEventBase)
+        self.assertFalse(hasattr(event, "__dict__"))
+        self.assertEqual(
+            {
+                "timestamp": 1640001112.223,
+                "hb_id": "HBID1",
+                "tx_hash": "0xTX",
+                "token_id": "42",
+                "base_amount": Decimal("1"),
+                "quote_amount": Decimal("2"),
+                "status": "OPEN",
+            },
+            dataclasses.asdict(event),
+        )
@@ -1,5 +1,6 @@
 import asyncio
 from copy import deepcopy
+from decimal import Decimal
 import json
 import multiprocessing as mp
 import time
@@ -437,6 +438,31 @@ class RemoteControlTest(TestCase):
         self.assertEqual(12345678999, broadcasted_evt.timestamp_received)
         self.assertEqual("test broadcast", broadcasted_evt.event_descriptor)
 
+    @patch('websockets.connect', new_callable=AsyncMock)
+    def test_remote_commands_broadcast_sends_decimals_as_numbers(self, ws_connect_mock):
+        ws_connect_mock.return_value = self._rce_setup()
+
+        self._remote_cmds_start_wait_ready()
+
+        self.remote_cmds.broadcast(RemoteCmdEvent(event_descriptor='test broadcast',
+                                                  price=Decimal("101.5"),
+                                                  inventory=Decimal("2")))
+
+        self._remote_cmds_start_wait_stopped(ws_connect_mock.return_value, wait_for_delivered=False)
+
+        sent_msgs = self.mocking_assistant.text_messages_sent_through_websocket(ws_connect_mock.return_value)
+
+        self.assertEqual(1, len(sent_msgs))
+
+        payload = json.loads(sent_msgs[0])
+
+        self.assertEqual(101.5, payload["price"])
+        self.assertEqual(2, payload["inventory"])
+        self.assertEqual(0, payload["volume"])
+        self.assertIsNone(payload["order_amount"])
+        for key in ("price", "inventory", "volume"):
+            self.assertIsInstance(payload[key], (int, float))
+
     # @patch('websockets.connect', new_callable=AsyncMock)
     # def test_remote_commands_broadcast_failure(self, ws_connect_mock):
     #     ws_connect_mock.return_value = self._rce_setup()